@@ -12,8 +12,23 @@ from typing import Dict, Optional, Callable, Any, List
 from collections import deque
 import websocket
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Prefer orjson on the message hot path; fall back to stdlib json
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: dict) -> str:
+        return orjson.dumps(data).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 
 class HeartbeatMetrics:
     """Track WebSocket heartbeat health metrics"""
@@ -199,7 +214,9 @@ class DerivWebSocket:
                 if self.ws is None:
                     logger.error("WebSocket is None, cannot run")
                     break
-                self.ws.run_forever()  # No built-in ping - we handle it ourselves
+                # No built-in ping - we handle it ourselves. Frames are decoded as
+                # JSON right after, so skip websocket-client's pure-Python UTF-8 pass
+                self.ws.run_forever(skip_utf8_validation=True)
             except Exception as e:
                 logger.error(f"WebSocket run error: {e}")
                 self._connection_error = str(e)
@@ -258,7 +275,8 @@ class DerivWebSocket:
     def _on_message(self, ws, message):
         """Handle incoming messages"""
         try:
-            data = json.loads(message)
+            # Frames may arrive as bytes (skip_utf8_validation); both loaders accept them
+            data = _json_loads(message)
             msg_type = data.get("msg_type")
             req_id = data.get("req_id")
             
@@ -530,7 +548,7 @@ class DerivWebSocket:
         data["req_id"] = req_id
         
         try:
-            self.ws.send(json.dumps(data))
+            self.ws.send(_json_dumps(data))
             return req_id
         except Exception as e:
             logger.error(f"Send error: {e}")
@@ -593,7 +611,7 @@ class DerivWebSocket:
                 
                 try:
                     start_time = time.time()
-                    self.ws.send(json.dumps(data_copy))
+                    self.ws.send(_json_dumps(data_copy))
                     logger.debug(f"Sent request with req_id {req_id}: {list(data.keys())}")
                     
                     # Wait for response
@@ -33,7 +33,7 @@ class RecoveryMode(Enum):
     PROGRESSIVE = "PROGRESSIVE"   # Old martingale-like (not recommended)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """Record of a single trade"""
     stake: float
@@ -45,7 +45,7 @@ class TradeRecord:
     timestamp: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMetrics:
     """Session trading metrics"""
     starting_balance: float
@@ -288,13 +288,13 @@ class HybridMoneyManager:
             win_rate = self.metrics.wins / self.metrics.total_trades
             if win_rate < 0.4:  # Less than 40% win rate
                 stake = min(stake, self.base_stake)  # Cap at base stake
-                logger.debug(f"Win rate cap applied: {win_rate*100:.1f}% -> stake capped to base")
+                logger.debug("Win rate cap applied: %.1f%% -> stake capped to base", win_rate * 100)
         
         # Final balance check
         if stake > balance * 0.5:
             stake = balance * 0.1  # Reduce to 10% if stake is too large
         
-        logger.debug(f"Calculated stake: {stake:.2f} (mode: {self.recovery_mode.value})")
+        logger.debug("Calculated stake: %.2f (mode: %s)", stake, self.recovery_mode.value)
         return stake
     
     def _calculate_fibonacci_stake(self) -> float:
@@ -318,8 +318,8 @@ class HybridMoneyManager:
         stake = self.base_stake * fib_multiplier
         
         logger.debug(
-            f"Fibonacci stake: {stake:.2f} | Level: {level + 1}/{self.max_levels} | "
-            f"Multiplier: {fib_multiplier} | Deficit: {self.metrics.deficit:.2f}"
+            "Fibonacci stake: %.2f | Level: %d/%d | Multiplier: %d | Deficit: %.2f",
+            stake, level + 1, self.max_levels, fib_multiplier, self.metrics.deficit
         )
         
         return stake
@@ -243,6 +243,65 @@ def calculate_adx(
     
     return adx, plus_di, minus_di
 
+def calculate_adx_latest(closes: List[float], period: int = 14) -> Optional[float]:
+    """
+    Latest ADX value for a close-only series.
+    
+    Same result as calculate_adx(closes, closes, closes, period)[0][-1], but
+    Wilder smoothing runs as a scalar recurrence in a single pass instead of
+    building the TR/DM/DI/DX lists.
+    """
+    n = len(closes)
+    if n < 2 * period:
+        return None
+    
+    multiplier = 2 / (period + 1)
+    
+    # Seed smoothed TR/+DM/-DM with the SMA of the first period moves
+    tr_seed = []
+    plus_seed = []
+    minus_seed = []
+    for i in range(1, period + 1):
+        change = closes[i] - closes[i - 1]
+        tr_seed.append(safe_float(abs(change)))
+        plus_seed.append(safe_float(change) if change > 0 else 0.0)
+        minus_seed.append(safe_float(-change) if change < 0 else 0.0)
+    
+    atr = safe_float(sum(tr_seed) / period)
+    smoothed_plus = safe_float(sum(plus_seed) / period)
+    smoothed_minus = safe_float(sum(minus_seed) / period)
+    
+    dx_seed = []
+    adx = 0.0
+    
+    for i in range(period, n):
+        if i > period:
+            change = closes[i] - closes[i - 1]
+            tr = safe_float(abs(change))
+            plus_dm = safe_float(change) if change > 0 else 0.0
+            minus_dm = safe_float(-change) if change < 0 else 0.0
+            atr = safe_float((tr - atr) * multiplier + atr)
+            smoothed_plus = safe_float((plus_dm - smoothed_plus) * multiplier + smoothed_plus)
+            smoothed_minus = safe_float((minus_dm - smoothed_minus) * multiplier + smoothed_minus)
+        
+        if atr == 0:
+            dx = 0.0
+        else:
+            pdi = (smoothed_plus / atr) * 100
+            mdi = (smoothed_minus / atr) * 100
+            di_sum = pdi + mdi
+            dx = 0.0 if di_sum == 0 else safe_float((abs(pdi - mdi) / di_sum) * 100)
+        
+        # ADX is smoothed DX, seeded with the SMA of the first period values
+        if len(dx_seed) < period:
+            dx_seed.append(dx)
+            if len(dx_seed) == period:
+                adx = safe_float(sum(dx_seed) / period)
+        else:
+            adx = safe_float((dx - adx) * multiplier + adx)
+    
+    return adx
+
 def calculate_atr(
     highs: List[float],
     lows: List[float],
@@ -561,8 +620,7 @@ class TechnicalIndicators:
     
     def calculate_adx(self, prices: List[float], period: int = 14) -> Optional[float]:
         """Calculate ADX and return latest value"""
-        adx, plus_di, minus_di = calculate_adx(prices, prices, prices, period)
-        return adx[-1] if adx else None
+        return calculate_adx_latest(prices, period)
     
     def calculate_atr(self, prices: List[float], period: int = 14) -> Optional[float]:
         """Calculate ATR and return latest value"""
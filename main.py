@@ -34,17 +34,30 @@ _early_cleanup()
 # Now safe to import modules - singletons will initialize with empty state
 import logging
 import asyncio
+import atexit
+import queue
 import signal
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
-# Configure logging
+# Configure logging - callers only enqueue records; a background listener
+# thread formats and writes them so trading/websocket threads never block on I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Listener adds the prefix
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout)
+        _queue_handler
     ]
 )
+_log_listener = QueueListener(_log_queue, _console_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit
 logger = logging.getLogger(__name__)
 
 # Configure throttled logging for high-frequency modules
@@ -20,6 +20,7 @@ class SymbolConfig:
     supports_minutes: bool
     supports_days: bool
     pip_size: float
+    tick_rate: Optional[float] = None  # Ticks per second; None when ticks arrive irregularly (forex)
     
 # Symbol definitions
 SYMBOLS: Dict[str, SymbolConfig] = {
@@ -36,7 +37,8 @@ SYMBOLS: Dict[str, SymbolConfig] = {
         supports_ticks=True,
         supports_minutes=True,
         supports_days=False,
-        pip_size=0.01
+        pip_size=0.01,
+        tick_rate=0.5
     ),
     "R_75": SymbolConfig(
         symbol="R_75",
@@ -50,7 +52,8 @@ SYMBOLS: Dict[str, SymbolConfig] = {
         supports_ticks=True,
         supports_minutes=True,
         supports_days=False,
-        pip_size=0.01
+        pip_size=0.01,
+        tick_rate=0.5
     ),
     "R_50": SymbolConfig(
         symbol="R_50",
@@ -64,7 +67,8 @@ SYMBOLS: Dict[str, SymbolConfig] = {
         supports_ticks=True,
         supports_minutes=True,
         supports_days=False,
-        pip_size=0.01
+        pip_size=0.01,
+        tick_rate=0.5
     ),
     "R_25": SymbolConfig(
         symbol="R_25",
@@ -78,7 +82,8 @@ SYMBOLS: Dict[str, SymbolConfig] = {
         supports_ticks=True,
         supports_minutes=True,
         supports_days=False,
-        pip_size=0.01
+        pip_size=0.01,
+        tick_rate=0.5
     ),
     "R_10": SymbolConfig(
         symbol="R_10",
@@ -92,7 +97,8 @@ SYMBOLS: Dict[str, SymbolConfig] = {
         supports_ticks=True,
         supports_minutes=True,
         supports_days=False,
-        pip_size=0.01
+        pip_size=0.01,
+        tick_rate=0.5
     ),
     # 1Hz Volatility Indices
     "1HZ100V": SymbolConfig(
@@ -107,7 +113,8 @@ SYMBOLS: Dict[str, SymbolConfig] = {
         supports_ticks=True,
         supports_minutes=True,
         supports_days=False,
-        pip_size=0.01
+        pip_size=0.01,
+        tick_rate=1.0
     ),
     "1HZ75V": SymbolConfig(
         symbol="1HZ75V",
@@ -121,7 +128,8 @@ SYMBOLS: Dict[str, SymbolConfig] = {
         supports_ticks=True,
         supports_minutes=True,
         supports_days=False,
-        pip_size=0.01
+        pip_size=0.01,
+        tick_rate=1.0
     ),
     "1HZ50V": SymbolConfig(
         symbol="1HZ50V",
@@ -135,7 +143,8 @@ SYMBOLS: Dict[str, SymbolConfig] = {
         supports_ticks=True,
         supports_minutes=True,
         supports_days=False,
-        pip_size=0.01
+        pip_size=0.01,
+        tick_rate=1.0
     ),
     # Forex/Commodities
     "frxXAUUSD": SymbolConfig(
@@ -215,6 +224,11 @@ def get_default_symbol() -> str:
     """Get default trading symbol"""
     return "R_100"
 
+def get_tick_rate(symbol: str) -> Optional[float]:
+    """Get ticks per second for a symbol, or None if its ticks arrive irregularly"""
+    config = get_symbol_config(symbol)
+    return config.tick_rate if config else None
+
 def get_default_duration(symbol: str) -> tuple:
     """Get default duration for a symbol (duration, unit)"""
     config = get_symbol_config(symbol)
@@ -4,7 +4,7 @@ Based on https://terminal.nextrader.live/
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from collections import deque
@@ -13,6 +13,7 @@ import math
 
 from indicators import TechnicalIndicators
 from strategy import DynamicThresholds
+from symbols import get_tick_rate
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,10 @@ class RiskLevel(Enum):
     VERY_HIGH = "VERY_HIGH"
 
 
+# Fixed indicator order for signal snapshots
+INDICATOR_KEYS = ("rsi", "ema", "macd", "stochastic", "adx")
+
+
 @dataclass
 class TerminalSignal:
     direction: str  # "BUY" or "SELL"
@@ -33,9 +38,22 @@ class TerminalSignal:
     entry_price: float
     take_profit: float
     stop_loss: float
-    indicators: Dict[str, Any] = field(default_factory=dict)
+    # (value, signal, strength) per INDICATOR_KEYS entry, None if unavailable
+    indicator_snapshot: Tuple[Optional[Tuple[float, str, float]], ...] = ()
     timestamp: float = field(default_factory=time.time)
     
+    @property
+    def indicators(self) -> Dict[str, Any]:
+        """Indicator scores rebuilt from the immutable snapshot"""
+        scores = {}
+        for name, entry in zip(INDICATOR_KEYS, self.indicator_snapshot):
+            if entry is None:
+                continue
+            value, label, strength = entry
+            label_key = "trend_strength" if name == "adx" else "signal"
+            scores[name] = {"value": value, label_key: label, "strength": strength}
+        return scores
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "direction": self.direction,
@@ -79,13 +97,18 @@ class TerminalStrategy:
         RiskLevel.VERY_HIGH: {"multiplier": 2.5, "max_levels": 3}
     }
     
+    # Martingale stake factors per risk level: multiplier ** (1 + level * 0.5)
+    STAKE_FACTORS = {
+        risk: tuple(cfg["multiplier"] ** (1 + level * 0.5) for level in range(cfg["max_levels"]))
+        for risk, cfg in RISK_MULTIPLIERS.items()
+    }
+    
     MIN_CONFIDENCE = 0.65  # Require strong signals
     MIN_TICKS = 50  # Proper warmup for accurate indicators
     
     def __init__(self, symbol: str = "R_100"):
         self.symbol = symbol
         self.indicators = TechnicalIndicators()
-        self.ticks: deque = deque(maxlen=200)
         self.prices: List[float] = []
         
         # Smart Analysis state
@@ -105,17 +128,23 @@ class TerminalStrategy:
         
         # Signal history
         self.signals: deque = deque(maxlen=100)
-        self.last_signal_time = 0
+        self.last_signal_time = 0  # Wall-clock time of last signal
         self.signal_cooldown = 12  # Proper cooldown for quality signals
+        
+        # Fixed-rate symbols time the cooldown in ticks (no clock reads on the
+        # tick path); irregular ones (forex) fall back to wall-clock time
+        self.tick_rate = get_tick_rate(symbol)
+        self._tick_idx = 0
+        self._last_signal_tick = -10**9
     
     def add_tick(self, tick: Dict[str, Any]) -> Optional[TerminalSignal]:
         """Add new tick data and analyze for signals"""
         if not self.is_trading:
             return None
         
-        self.ticks.append(tick)
         price = tick.get("quote", tick.get("price", 0))
         if price > 0:
+            self._tick_idx += 1
             self.prices.append(price)
             if len(self.prices) > 200:
                 self.prices = self.prices[-200:]
@@ -133,7 +162,7 @@ class TerminalStrategy:
             return None
         
         # Check cooldown
-        if time.time() - self.last_signal_time < self.signal_cooldown:
+        if self._in_cooldown():
             return None
         
         # Calculate all indicators
@@ -174,11 +203,12 @@ class TerminalStrategy:
             entry_price=current_price,
             take_profit=take_profit,
             stop_loss=stop_loss,
-            indicators=indicator_scores
+            indicator_snapshot=self._snapshot_indicators(indicator_scores)
         )
         
         self.signals.append(signal)
-        self.last_signal_time = time.time()
+        self._last_signal_tick = self._tick_idx
+        self.last_signal_time = signal.timestamp
         
         logger.info(f"Terminal Signal: {direction} @ {probability*100:.1f}% prob, Risk: {risk_level.value}")
         
@@ -254,15 +284,27 @@ class TerminalStrategy:
         
         return scores
     
+    def _snapshot_indicators(self, scores: Dict[str, Any]) -> Tuple[Optional[Tuple[float, str, float]], ...]:
+        """Capture indicator scores as a fixed-length tuple for the emitted signal"""
+        snapshot = []
+        for name in INDICATOR_KEYS:
+            score = scores.get(name)
+            if score is None:
+                snapshot.append(None)
+            else:
+                label = score["trend_strength"] if name == "adx" else score["signal"]
+                snapshot.append((score["value"], label, score["strength"]))
+        return tuple(snapshot)
+    
     def _calculate_probability(self, scores: Dict[str, Any]) -> float:
         """Calculate weighted probability from indicator scores"""
         total_weight = 0
         weighted_sum = 0
         
         for indicator, weight in self.WEIGHTS.items():
-            if indicator in scores and scores[indicator].get("signal") != "NEUTRAL":
-                strength = scores[indicator].get("strength", 0)
-                weighted_sum += weight * strength
+            score = scores.get(indicator)
+            if score is not None and score.get("signal") != "NEUTRAL":
+                weighted_sum += weight * score.get("strength", 0)
                 total_weight += weight
         
         if total_weight == 0:
@@ -272,15 +314,11 @@ class TerminalStrategy:
         base_prob = weighted_sum / total_weight
         probability = 0.5 + (base_prob * 0.5)
         
-        # ADX boost for strong trends
-        if "adx" in scores:
-            adx_val = scores["adx"].get("value", 0)
-            if adx_val > 25:
-                probability = min(probability * 1.1, 0.95)
-            elif adx_val < 15:
-                probability *= 0.9
+        # ADX boost for strong trends, damping for weak ones
+        adx_val = scores.get("adx", {}).get("value", 20)
+        probability *= 1.1 if adx_val > 25 else (0.9 if adx_val < 15 else 1.0)
         
-        return min(max(probability, 0), 1)
+        return min(max(probability, 0), 0.95 if adx_val > 25 else 1)
     
     def _determine_direction(self, scores: Dict[str, Any]) -> Optional[str]:
         """Determine trade direction from indicator consensus"""
@@ -384,9 +422,8 @@ class TerminalStrategy:
         if not self.hybrid_recovery_enabled:
             return base_stake
         
-        risk_config = self.RISK_MULTIPLIERS[self.current_risk]
-        multiplier = risk_config["multiplier"]
-        max_levels = risk_config["max_levels"]
+        stake_factors = self.STAKE_FACTORS[self.current_risk]
+        max_levels = len(stake_factors)
         
         if self.current_level >= max_levels:
             logger.warning(f"Max recovery level reached ({max_levels})")
@@ -395,8 +432,7 @@ class TerminalStrategy:
         # Progressive recovery calculation
         if self.consecutive_losses > 0:
             # Martingale mode
-            exponent = 1 + (self.current_level * 0.5)
-            stake = base_stake * (multiplier ** exponent)
+            stake = base_stake * stake_factors[self.current_level]
         elif self.consecutive_wins > 2:
             # Anti-Martingale mode (increase on wins)
             stake = base_stake * (1 + (self.consecutive_wins * 0.2))
@@ -416,6 +452,23 @@ class TerminalStrategy:
             self.consecutive_wins = 0
             self.current_level = min(self.current_level + 1, 5)
     
+    @property
+    def cooldown_ticks(self) -> int:
+        """signal_cooldown expressed in ticks (0 for symbols without a fixed tick rate)"""
+        if not self.tick_rate:
+            return 0
+        return max(1, round(self.signal_cooldown * self.tick_rate))
+    
+    def _in_cooldown(self) -> bool:
+        """Check the signal cooldown - in ticks at a fixed tick rate, else wall-clock"""
+        if self.tick_rate:
+            return self._tick_idx - self._last_signal_tick < self.cooldown_ticks
+        return time.time() - self.last_signal_time < self.signal_cooldown
+    
+    def cooldown_remaining_ticks(self) -> int:
+        """Ticks left before a new signal may fire (0 when not in cooldown or not tick-timed)"""
+        return max(0, self.cooldown_ticks - (self._tick_idx - self._last_signal_tick))
+    
     def set_risk_level(self, risk: RiskLevel):
         """Set current risk level"""
         self.current_risk = risk
@@ -432,7 +485,7 @@ class TerminalStrategy:
         """Get strategy statistics"""
         return {
             "symbol": self.symbol,
-            "ticks_count": len(self.ticks),
+            "ticks_count": min(self._tick_idx, 200),
             "signals_count": len(self.signals),
             "smart_analysis": self.smart_analysis_enabled,
             "hybrid_recovery": self.hybrid_recovery_enabled,
@@ -444,10 +497,11 @@ class TerminalStrategy:
     
     def reset(self):
         """Reset strategy state - unified lifecycle hook"""
-        self.ticks.clear()
+        self._tick_idx = 0
         self.prices.clear()
         self.signals.clear()
         self.last_signal_time = 0
+        self._last_signal_tick = -10**9
         self.consecutive_wins = 0
         self.consecutive_losses = 0
         self.current_level = 0
@@ -458,6 +512,7 @@ class TerminalStrategy:
         """Start trading session - unified lifecycle hook"""
         self._is_trading = True
         self.last_signal_time = 0
+        self._last_signal_tick = -10**9
         logger.info(f"[{self.symbol}] Terminal trading started")
     
     def stop_trading(self):
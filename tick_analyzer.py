@@ -10,7 +10,77 @@ from collections import deque
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+class _RollingWindow:
+    """Fixed-size price window with an exact (two-pass) std"""
+    
+    __slots__ = ("size", "values")
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque = deque(maxlen=size)
+    
+    def clear(self):
+        self.values.clear()
+    
+    def append(self, price: float):
+        self.values.append(price)
+    
+    def std(self) -> float:
+        # Two passes over at most 50 prices are cheap, and match the original
+        # computation bit for bit so threshold ties resolve the same way
+        values = self.values
+        n = len(values)
+        if n < self.size:
+            return 0
+        mean = sum(values) / n
+        variance = sum((p - mean) ** 2 for p in values) / n
+        return variance ** 0.5
+
+
+class _WindowExtrema:
+    """Sliding-window min/max via monotonic deques (amortized O(1))"""
+    
+    __slots__ = ("size", "_count", "_lows", "_highs")
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._lows: deque = deque()  # (index, price), prices ascending
+        self._highs: deque = deque()  # (index, price), prices descending
+        self.clear()
+    
+    def clear(self):
+        self._count = 0
+        self._lows.clear()
+        self._highs.clear()
+    
+    def append(self, price: float):
+        idx = self._count
+        self._count += 1
+        expired = idx - self.size
+        
+        lows = self._lows
+        while lows and lows[-1][1] >= price:
+            lows.pop()
+        lows.append((idx, price))
+        if lows[0][0] <= expired:
+            lows.popleft()
+        
+        highs = self._highs
+        while highs and highs[-1][1] <= price:
+            highs.pop()
+        highs.append((idx, price))
+        if highs[0][0] <= expired:
+            highs.popleft()
+    
+    def low(self) -> float:
+        return self._lows[0][1]
+    
+    def high(self) -> float:
+        return self._highs[0][1]
+
+
+@dataclass(slots=True)
 class TickSignal:
     """Tick analyzer signal"""
     direction: str  # BUY or SELL
@@ -46,48 +116,98 @@ class TickAnalyzerStrategy:
         self.prices: deque = deque(maxlen=200)
         self.last_signal_time = 0
         self.signal_cooldown = 12  # Proper cooldown for quality signals
+        
+        # Rolling volatility windows (10/20/50 ticks) updated once per tick
+        self._vol_windows: Dict[int, _RollingWindow] = {
+            window: _RollingWindow(window) for window in (10, self.LONG_WINDOW, 50)
+        }
+        # Min/max over the last 10 and 50 ticks; prior_range is the 10-tick
+        # low/high before the latest tick, used for breakout checks
+        self._range10 = _WindowExtrema(self.MEDIUM_WINDOW)
+        self._range50 = _WindowExtrema(50)
+        self._prior_range: tuple = (None, None)
+        # Volatility of each LONG_WINDOW-tick window, recorded as the window completes
+        self._window_vols: deque = deque(maxlen=200 - self.LONG_WINDOW)
+        
+        # Incremental streak state: tick indices of the current run of moves
+        self._tick_count = 0
+        self._streak_up: Optional[bool] = None
+        self._streak_ticks: deque = deque()
+        self._last_flat = False
     
     def add_tick(self, tick: Dict[str, Any]) -> Optional[TickSignal]:
         """Add tick and analyze for patterns"""
+        if not self._ingest(tick):
+            return None
+        return self._signal_if_ready()
+    
+    def add_ticks(self, ticks: List[Dict[str, Any]]) -> Optional[TickSignal]:
+        """
+        Add a burst of ticks (e.g. history preload), analyzing only once
+        
+        Rolling state is updated for every tick exactly as add_tick would,
+        but the pattern analysis runs only after the last one.
+        """
+        ingested = False
+        for tick in ticks:
+            if self._ingest(tick):
+                ingested = True
+        return self._signal_if_ready() if ingested else None
+    
+    def _ingest(self, tick: Dict[str, Any]) -> bool:
+        """Fold one tick into the rolling state; False if the quote is invalid"""
         quote = tick.get("quote", 0)
         if quote <= 0:
-            return None
+            return False
         
         self.tick_history.append(tick)
+        self._update_window_vol()
+        self._update_streak(quote)
         self.prices.append(quote)
-        
-        # Check cooldown
-        current_time = time.time()
-        if current_time - self.last_signal_time < self.signal_cooldown:
+        for window in self._vol_windows.values():
+            window.append(quote)
+        self._update_ranges(quote)
+        return True
+    
+    def _signal_if_ready(self) -> Optional[TickSignal]:
+        """Run the analysis once warmed up and out of cooldown"""
+        # Need minimum data (cheaper than reading the clock, so check first)
+        if len(self.prices) < self.MIN_TICKS:
             return None
         
-        # Need minimum data
-        if len(self.prices) < self.MIN_TICKS:
+        # Check cooldown
+        now = time.time()
+        if now - self.last_signal_time < self.signal_cooldown:
             return None
         
-        return self._analyze()
+        return self._analyze(now)
     
-    def _analyze(self) -> Optional[TickSignal]:
-        """Analyze tick patterns"""
-        prices = list(self.prices)
+    def _analyze(self, now: float) -> Optional[TickSignal]:
+        """Analyze tick patterns; now is the tick's clock reading from add_tick"""
+        # Read the deque in place - only the last two ticks are indexed here
+        prices = self.prices
+        current = prices[-1]
         
         # Calculate consecutive streak
-        streak_direction, streak_count = self._calculate_streak(prices)
+        streak_direction, streak_count = self._calculate_streak()
         
         # Calculate momentum at different windows
-        short_momentum = self._calculate_momentum(prices, self.SHORT_WINDOW)
-        medium_momentum = self._calculate_momentum(prices, self.MEDIUM_WINDOW)
-        long_momentum = self._calculate_momentum(prices, self.LONG_WINDOW)
-        
-        # Detect pattern type
-        pattern = self._detect_pattern(prices, short_momentum, medium_momentum, long_momentum)
+        short_momentum = self._calculate_momentum(self.SHORT_WINDOW)
+        medium_momentum = self._calculate_momentum(self.MEDIUM_WINDOW)
+        long_momentum = self._calculate_momentum(self.LONG_WINDOW)
         
         # Calculate volatility
-        volatility = self._calculate_volatility(prices)
-        vol_percentile = self._volatility_percentile(prices)
+        volatility = self._calculate_volatility()
+        vol_percentile = self._volatility_percentile()
         
         # Support/Resistance levels
-        support, resistance = self._find_sr_levels(prices)
+        support, resistance = self._find_sr_levels()
+        
+        # Detect pattern type
+        pattern = self._detect_pattern(
+            current, short_momentum, medium_momentum, long_momentum,
+            volatility, support, resistance
+        )
         
         # Pattern data
         pattern_data = {
@@ -101,7 +221,7 @@ class TickAnalyzerStrategy:
             "vol_percentile": vol_percentile,
             "support": support,
             "resistance": resistance,
-            "current_price": prices[-1]
+            "current_price": current
         }
         
         signal = None
@@ -126,7 +246,7 @@ class TickAnalyzerStrategy:
                 confidence=confidence,
                 reason=f"Reversal after {streak_count} {streak_direction} ticks",
                 pattern_data=pattern_data,
-                timestamp=time.time(),
+                timestamp=now,
                 symbol=self.symbol
             )
         
@@ -150,13 +270,13 @@ class TickAnalyzerStrategy:
                     confidence=confidence,
                     reason=f"Momentum acceleration: {short_momentum:.4f}",
                     pattern_data=pattern_data,
-                    timestamp=time.time(),
+                    timestamp=now,
                     symbol=self.symbol
                 )
         
         # Strategy 3: Breakout from consolidation
         elif pattern == "breakout":
-            direction = "BUY" if prices[-1] > prices[-2] else "SELL"
+            direction = "BUY" if current > prices[-2] else "SELL"
             confidence = 0.65
             
             signal = TickSignal(
@@ -165,13 +285,12 @@ class TickAnalyzerStrategy:
                 confidence=confidence,
                 reason=f"Breakout from consolidation",
                 pattern_data=pattern_data,
-                timestamp=time.time(),
+                timestamp=now,
                 symbol=self.symbol
             )
         
         # Strategy 4: Support/Resistance bounce
         elif pattern == "sr_bounce":
-            current = prices[-1]
             if support and abs(current - support) < volatility:
                 signal = TickSignal(
                     direction="BUY",
@@ -179,7 +298,7 @@ class TickAnalyzerStrategy:
                     confidence=0.60,
                     reason=f"Support bounce at {support:.2f}",
                     pattern_data=pattern_data,
-                    timestamp=time.time(),
+                    timestamp=now,
                     symbol=self.symbol
                 )
             elif resistance and abs(current - resistance) < volatility:
@@ -189,7 +308,7 @@ class TickAnalyzerStrategy:
                     confidence=0.60,
                     reason=f"Resistance rejection at {resistance:.2f}",
                     pattern_data=pattern_data,
-                    timestamp=time.time(),
+                    timestamp=now,
                     symbol=self.symbol
                 )
         
@@ -205,138 +324,156 @@ class TickAnalyzerStrategy:
         
         return None
     
-    def _calculate_streak(self, prices: List[float]) -> tuple:
+    def _update_streak(self, quote: float):
+        """Extend or restart the current up/down run with the incoming tick"""
+        tick_idx = self._tick_count
+        self._tick_count += 1
+        if not self.prices:
+            return
+        
+        last = self.prices[-1]
+        if quote == last:
+            self._last_flat = True
+        else:
+            up = quote > last
+            if up != self._streak_up:
+                self._streak_up = up
+                self._streak_ticks.clear()
+            self._streak_ticks.append(tick_idx)
+            self._last_flat = False
+        
+        # Only moves that are still inside the 200-tick window count
+        first_idx = self._tick_count - min(len(self.prices) + 1, self.prices.maxlen)
+        ticks = self._streak_ticks
+        while ticks and ticks[0] <= first_idx:
+            ticks.popleft()
+    
+    def _calculate_streak(self) -> tuple:
         """Calculate consecutive up/down streak"""
-        if len(prices) < 2:
+        if len(self.prices) < 2:
             return "NONE", 0
         
-        streak_count = 1
-        last_direction = "UP" if prices[-1] > prices[-2] else "DOWN"
+        # A flat last tick counts as DOWN and skips back to earlier moves
+        if self._last_flat:
+            run = len(self._streak_ticks) if self._streak_up is False else 0
+            return "DOWN", 1 + run
         
-        for i in range(len(prices) - 2, 0, -1):
-            if prices[i] == prices[i - 1]:
-                continue
-            
-            current_direction = "UP" if prices[i] > prices[i - 1] else "DOWN"
-            if current_direction == last_direction:
-                streak_count += 1
-            else:
-                break
-        
-        return last_direction, streak_count
+        return ("UP" if self._streak_up else "DOWN"), len(self._streak_ticks)
     
-    def _calculate_momentum(self, prices: List[float], window: int) -> float:
+    def _calculate_momentum(self, window: int) -> float:
         """Calculate price momentum over window"""
+        prices = self.prices
         if len(prices) < window:
             return 0
         
-        recent = prices[-window:]
-        return (recent[-1] - recent[0]) / recent[0] if recent[0] != 0 else 0
+        first = prices[-window]
+        return (prices[-1] - first) / first if first != 0 else 0
     
-    def _calculate_volatility(self, prices: List[float], window: int = 20) -> float:
-        """Calculate price volatility"""
-        if len(prices) < window:
-            return 0
-        
-        recent = prices[-window:]
-        mean = sum(recent) / len(recent)
-        variance = sum((p - mean) ** 2 for p in recent) / len(recent)
-        return variance ** 0.5
+    def _calculate_volatility(self, window: Optional[int] = None) -> float:
+        """Calculate price volatility over the last 10, LONG_WINDOW (default) or 50 ticks"""
+        return self._vol_windows[window or self.LONG_WINDOW].std()
     
-    def _volatility_percentile(self, prices: List[float]) -> float:
+    def _update_window_vol(self):
+        """Record volatility of the LONG_WINDOW ticks preceding the incoming tick"""
+        window = self._vol_windows[self.LONG_WINDOW]
+        if len(window.values) < window.size:
+            return
+        self._window_vols.append(window.std())
+    
+    def _volatility_percentile(self) -> float:
         """Calculate current volatility percentile"""
-        if len(prices) < 50:
+        if len(self.prices) < 50:
             return 50
         
-        volatilities = []
-        for i in range(20, len(prices)):
-            window = prices[i-20:i]
-            mean = sum(window) / 20
-            variance = sum((p - mean) ** 2 for p in window) / 20
-            volatilities.append(variance ** 0.5)
-        
+        volatilities = self._window_vols
         current_vol = volatilities[-1]
-        below_count = sum(1 for v in volatilities if v < current_vol)
+        below_count = sum(map(current_vol.__gt__, volatilities))
         return (below_count / len(volatilities)) * 100
     
     def _detect_pattern(
         self,
-        prices: List[float],
+        current: float,
         short_mom: float,
         medium_mom: float,
-        long_mom: float
+        long_mom: float,
+        volatility: float,
+        support: Optional[float],
+        resistance: Optional[float]
     ) -> str:
-        """Detect price pattern"""
+        """Detect price pattern from indicators already computed by the caller"""
         # Acceleration: short momentum stronger than medium
-        if abs(short_mom) > abs(medium_mom) * 1.5 and abs(short_mom) > 0.001:
+        short_abs = abs(short_mom)
+        if short_abs > 0.001 and short_abs > abs(medium_mom) * 1.5:
             return "acceleration"
         
         # Consolidation: low volatility
-        vol = self._calculate_volatility(prices, 10)
-        avg_vol = self._calculate_volatility(prices, 50)
+        vol = self._calculate_volatility(10)
+        avg_vol = self._calculate_volatility(50)
         
         if vol < avg_vol * 0.5:
             # Check for breakout
-            recent_range = max(prices[-10:]) - min(prices[-10:])
-            if prices[-1] > max(prices[-11:-1]) or prices[-1] < min(prices[-11:-1]):
+            prior_low, prior_high = self._prior_range
+            if current > prior_high or current < prior_low:
                 return "breakout"
             return "consolidation"
         
         # Trending
-        if all(m > 0 for m in [short_mom, medium_mom, long_mom]):
+        if short_mom > 0 and medium_mom > 0 and long_mom > 0:
             return "uptrend"
-        elif all(m < 0 for m in [short_mom, medium_mom, long_mom]):
+        elif short_mom < 0 and medium_mom < 0 and long_mom < 0:
             return "downtrend"
         
         # S/R bounce detection
-        support, resistance = self._find_sr_levels(prices)
-        current = prices[-1]
-        vol = self._calculate_volatility(prices)
-        
-        if support and abs(current - support) < vol * 2:
+        band = volatility * 2
+        if support and abs(current - support) < band:
             return "sr_bounce"
-        if resistance and abs(current - resistance) < vol * 2:
+        if resistance and abs(current - resistance) < band:
             return "sr_bounce"
         
         return "ranging"
     
-    def _find_sr_levels(self, prices: List[float]) -> tuple:
+    def _update_ranges(self, quote: float):
+        """Slide the 10/50-tick min/max windows forward by one tick"""
+        range10 = self._range10
+        if len(self.prices) > 1:
+            self._prior_range = (range10.low(), range10.high())
+        range10.append(quote)
+        self._range50.append(quote)
+    
+    def _find_sr_levels(self) -> tuple:
         """Find support and resistance levels"""
-        if len(prices) < 20:
+        if len(self.prices) < 20:
             return None, None
         
-        recent = prices[-50:] if len(prices) >= 50 else prices
-        
-        # Simple S/R: local min/max
-        support = min(recent)
-        resistance = max(recent)
-        
-        return support, resistance
+        # Simple S/R: local min/max over the last 50 ticks
+        return self._range50.low(), self._range50.high()
     
     def get_analysis(self) -> Dict[str, Any]:
         """Get current tick analysis"""
         if len(self.prices) < self.LONG_WINDOW:
             return {"status": "insufficient_data", "ticks": len(self.prices)}
         
-        prices = list(self.prices)
-        streak_dir, streak_count = self._calculate_streak(prices)
+        streak_dir, streak_count = self._calculate_streak()
+        short_momentum = self._calculate_momentum(self.SHORT_WINDOW)
+        medium_momentum = self._calculate_momentum(self.MEDIUM_WINDOW)
+        long_momentum = self._calculate_momentum(self.LONG_WINDOW)
+        volatility = self._calculate_volatility()
+        support, resistance = self._find_sr_levels()
         
         return {
             "status": "ready",
-            "ticks": len(prices),
-            "current_price": prices[-1],
+            "ticks": len(self.prices),
+            "current_price": self.prices[-1],
             "streak_direction": streak_dir,
             "streak_count": streak_count,
-            "short_momentum": self._calculate_momentum(prices, self.SHORT_WINDOW),
-            "medium_momentum": self._calculate_momentum(prices, self.MEDIUM_WINDOW),
-            "long_momentum": self._calculate_momentum(prices, self.LONG_WINDOW),
-            "volatility": self._calculate_volatility(prices),
-            "vol_percentile": self._volatility_percentile(prices),
+            "short_momentum": short_momentum,
+            "medium_momentum": medium_momentum,
+            "long_momentum": long_momentum,
+            "volatility": volatility,
+            "vol_percentile": self._volatility_percentile(),
             "pattern": self._detect_pattern(
-                prices,
-                self._calculate_momentum(prices, self.SHORT_WINDOW),
-                self._calculate_momentum(prices, self.MEDIUM_WINDOW),
-                self._calculate_momentum(prices, self.LONG_WINDOW)
+                self.prices[-1], short_momentum, medium_momentum, long_momentum,
+                volatility, support, resistance
             )
         }
     
@@ -344,5 +481,15 @@ class TickAnalyzerStrategy:
         """Reset strategy state"""
         self.tick_history.clear()
         self.prices.clear()
+        for window in self._vol_windows.values():
+            window.clear()
+        self._range10.clear()
+        self._range50.clear()
+        self._prior_range = (None, None)
+        self._window_vols.clear()
+        self._tick_count = 0
+        self._streak_up = None
+        self._streak_ticks.clear()
+        self._last_flat = False
         self.last_signal_time = 0
         logger.info(f"[TICK {self.symbol}] Strategy reset")
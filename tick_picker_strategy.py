@@ -7,13 +7,14 @@ import logging
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from collections import deque
+from itertools import islice
 import time
 import math
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TickPickerSignal:
     direction: str  # "BUY" or "SELL"
     confidence: float
@@ -21,7 +22,7 @@ class TickPickerSignal:
     streak: int
     momentum: float
     entry_price: float
-    analysis: Dict[str, Any] = field(default_factory=dict)
+    analysis: Optional[Dict[str, Any]] = None
     timestamp: float = field(default_factory=time.time)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -32,7 +33,11 @@ class TickPickerSignal:
             "streak": self.streak,
             "momentum": self.momentum,
             "entry_price": self.entry_price,
-            "analysis": self.analysis,
+            # Analysis keeps full precision; round only for display/serialization
+            "analysis": {
+                key: round(value, 4) if isinstance(value, float) else value
+                for key, value in self.analysis.items()
+            } if self.analysis else {},
             "timestamp": self.timestamp
         }
 
@@ -53,26 +58,45 @@ class TickPickerStrategy:
     SHORT_WINDOW = 5
     MEDIUM_WINDOW = 10
     LONG_WINDOW = 20
+    # Negative buffer offsets of the reference tick for each window
+    MOMENTUM_OFFSETS = (-(SHORT_WINDOW + 1), -(MEDIUM_WINDOW + 1), -(LONG_WINDOW + 1))
     
     # Thresholds - STRICT for quality signals
     STREAK_THRESHOLD = 3  # Require meaningful streak
     REVERSAL_THRESHOLD = 5  # Require extended streak for reversal
     MIN_CONFIDENCE = 0.60  # Require moderate confidence
     MIN_TICKS = 30  # Proper warmup for pattern accuracy
+    SIGNAL_HISTORY = 100  # Window reported as signals_count in get_stats
+    CHART_WINDOW = 50  # Ticks shown (and regressed) in get_chart_data
+    
+    # Trade direction per pattern, indexed by "streak is up":
+    # reversals trade against the streak, continuations with it
+    PATTERN_DIRECTIONS = {
+        "REVERSAL": ("BUY", "SELL"),
+        "UPTREND": ("BUY", "BUY"),
+        "DOWNTREND": ("SELL", "SELL"),
+        "CONTINUATION": ("SELL", "BUY"),
+    }
     
     def __init__(self, symbol: str = "R_100"):
         self.symbol = symbol
-        self.ticks: deque = deque(maxlen=200)
-        self.prices: List[float] = []
-        self.directions: List[int] = []  # 1=up, -1=down, 0=same
+        self._tick_count = 0
+        # Fixed-size ring buffers - appends drop the oldest tick in O(1)
+        self.prices: deque = deque(maxlen=200)
+        self.directions: deque = deque(maxlen=200)  # 1=up, -1=down, 0=same
+        
+        # Running sums of y and x*y over the chart window (x = 0..n-1)
+        self._chart_sum_y = 0.0
+        self._chart_sum_xy = 0.0
+        self._chart_updates = 0
         
         # Pattern tracking
         self.current_streak = 0
         self.streak_direction = 0  # 1=up, -1=down
         self.last_price = 0
         
-        # Signal history
-        self.signals: deque = deque(maxlen=100)
+        # Signal history - only the count is reported, so signals aren't retained
+        self.signals_count = 0
         self.last_signal_time = 0
         self.signal_cooldown = 10  # Proper cooldown for pattern confirmation
         
@@ -82,45 +106,57 @@ class TickPickerStrategy:
         self.current_level = 0
         self.max_level = 5
         self.multiplier = 2.0
+        self._stake_table = self._build_stake_table()
     
     def add_tick(self, tick: Dict[str, Any]):
         """Add new tick data"""
+        if not self._ingest(tick):
+            return
+        
+        # Analyze for trading signal
+        return self.analyze()
+    
+    def add_ticks(self, ticks: List[Dict[str, Any]]) -> Optional[TickPickerSignal]:
+        """
+        Add a burst of ticks (e.g. history preload), analyzing only once
+        
+        Every tick updates prices, streak and chart state exactly as add_tick
+        would, but the pattern analysis runs only after the last one, so no
+        intermediate signals are emitted and no cooldown is started mid-burst.
+        
+        Returns:
+            TickPickerSignal if the pattern after the last tick qualifies
+        """
+        ingested = False
+        for tick in ticks:
+            if self._ingest(tick):
+                ingested = True
+        
+        return self.analyze() if ingested else None
+    
+    def _ingest(self, tick: Dict[str, Any]) -> bool:
+        """Update tick state without analyzing; returns False for invalid ticks"""
         price = tick.get("quote", tick.get("price", 0))
         if price <= 0:
-            return
+            return False
         
-        self.ticks.append(tick)
+        self._tick_count += 1
         self.prices.append(price)
+        self._update_chart_sums(price)
         
         # Calculate direction
-        if self.last_price > 0:
-            if price > self.last_price:
-                direction = 1
-            elif price < self.last_price:
-                direction = -1
-            else:
-                direction = 0
-            
+        last_price = self.last_price
+        if last_price > 0:
+            direction = (price > last_price) - (price < last_price)
             self.directions.append(direction)
             
-            # Update streak
-            if direction != 0:
-                if direction == self.streak_direction:
-                    self.current_streak += 1
-                else:
-                    self.streak_direction = direction
-                    self.current_streak = 1
+            # Update streak - extend on same direction, restart at 1 otherwise
+            if direction:
+                self.current_streak = self.current_streak * (direction == self.streak_direction) + 1
+                self.streak_direction = direction
         
         self.last_price = price
-        
-        # Trim lists
-        if len(self.prices) > 200:
-            self.prices = self.prices[-200:]
-        if len(self.directions) > 200:
-            self.directions = self.directions[-200:]
-        
-        # Analyze for trading signal
-        return self.analyze()
+        return True
     
     def analyze(self) -> Optional[TickPickerSignal]:
         """
@@ -129,17 +165,29 @@ class TickPickerStrategy:
         Returns:
             TickPickerSignal if pattern detected
         """
-        if len(self.prices) < self.MIN_TICKS:
+        prices = self.prices
+        if len(prices) < self.MIN_TICKS:
+            return None
+        
+        # Check cooldown - one clock read serves the check and the signal stamp
+        now = time.time()
+        if now - self.last_signal_time < self.signal_cooldown:
             return None
         
-        # Check cooldown
-        if time.time() - self.last_signal_time < self.signal_cooldown:
+        # Reversal depends only on the streak and pre-empts every other pattern,
+        # so a too-weak reversal means no signal - skip the momentum work
+        if (self.current_streak >= self.REVERSAL_THRESHOLD
+                and self._reversal_confidence() < self.MIN_CONFIDENCE):
             return None
         
-        # Calculate momentum for different timeframes
-        short_momentum = self._calculate_momentum(self.SHORT_WINDOW)
-        medium_momentum = self._calculate_momentum(self.MEDIUM_WINDOW)
-        long_momentum = self._calculate_momentum(self.LONG_WINDOW)
+        # Calculate momentum for different timeframes, inline: MIN_TICKS exceeds
+        # LONG_WINDOW so every offset is in range, and stored prices are > 0
+        last = prices[-1]
+        short_off, medium_off, long_off = self.MOMENTUM_OFFSETS
+        short_ref, medium_ref, long_ref = prices[short_off], prices[medium_off], prices[long_off]
+        short_momentum = (last - short_ref) / short_ref * 100
+        medium_momentum = (last - medium_ref) / medium_ref * 100
+        long_momentum = (last - long_ref) / long_ref * 100
         
         # Detect pattern
         pattern, confidence = self._detect_pattern(short_momentum, medium_momentum, long_momentum)
@@ -148,10 +196,10 @@ class TickPickerStrategy:
             return None
         
         # Determine direction
-        direction = self._get_direction_from_pattern(pattern, short_momentum)
-        
-        if direction is None:
+        directions = self.PATTERN_DIRECTIONS.get(pattern)
+        if directions is None:
             return None
+        direction = directions[self.streak_direction > 0]
         
         signal = TickPickerSignal(
             direction=direction,
@@ -159,35 +207,31 @@ class TickPickerStrategy:
             pattern=pattern,
             streak=self.current_streak,
             momentum=short_momentum,
-            entry_price=self.prices[-1],
+            entry_price=last,
             analysis={
-                "short_momentum": round(short_momentum, 4),
-                "medium_momentum": round(medium_momentum, 4),
-                "long_momentum": round(long_momentum, 4),
+                "short_momentum": short_momentum,
+                "medium_momentum": medium_momentum,
+                "long_momentum": long_momentum,
                 "streak_direction": "UP" if self.streak_direction > 0 else "DOWN",
                 "streak_count": self.current_streak
-            }
+            },
+            timestamp=now
         )
         
-        self.signals.append(signal)
-        self.last_signal_time = time.time()
+        self.signals_count += 1
+        self.last_signal_time = now
         
         logger.info(f"TickPicker Signal: {direction} pattern={pattern} @ {confidence*100:.1f}%")
         
         return signal
     
-    def _calculate_momentum(self, window: int) -> float:
-        """Calculate momentum for given window"""
-        if len(self.prices) < window + 1:
-            return 0
-        
-        recent = self.prices[-window:]
-        oldest = self.prices[-(window+1)]
-        
-        if oldest == 0:
-            return 0
-        
-        return (recent[-1] - oldest) / oldest * 100
+    def _reversal_confidence(self) -> float:
+        """Confidence of a reversal after the current (long) streak"""
+        # Long streak, expect reversal - confidence starts lower
+        base_confidence = 0.55
+        streak_bonus = min((self.current_streak - self.REVERSAL_THRESHOLD) * 0.04, 0.20)
+        confidence = base_confidence + streak_bonus
+        return min(confidence, 0.80)
     
     def _detect_pattern(self, short_mom: float, med_mom: float, long_mom: float) -> tuple:
         """
@@ -196,66 +240,68 @@ class TickPickerStrategy:
         Returns:
             (pattern_name, confidence)
         """
+        streak = self.current_streak
+        
         # STRICT: Require minimum streak for any pattern except trend
         # Reversal Detection - ONLY if streak threshold met
-        if self.current_streak >= self.REVERSAL_THRESHOLD:
-            # Long streak, expect reversal - confidence starts lower
-            base_confidence = 0.55
-            streak_bonus = min((self.current_streak - self.REVERSAL_THRESHOLD) * 0.04, 0.20)
-            confidence = base_confidence + streak_bonus
-            return ("REVERSAL", min(confidence, 0.80))
+        if streak >= self.REVERSAL_THRESHOLD:
+            return ("REVERSAL", self._reversal_confidence())
+        
+        abs_short, abs_med, abs_long = abs(short_mom), abs(med_mom), abs(long_mom)
         
         # STRICT: Momentum must exceed minimum threshold for trend detection
         min_momentum = 0.001  # Minimum momentum threshold
         
         # Trend Detection - require meaningful momentum
-        if short_mom > min_momentum and med_mom > min_momentum and long_mom > min_momentum:
-            alignment = min(abs(short_mom), abs(med_mom), abs(long_mom))
+        up = short_mom > min_momentum and med_mom > min_momentum and long_mom > min_momentum
+        if up or (short_mom < -min_momentum and med_mom < -min_momentum and long_mom < -min_momentum):
+            # Weakest of the three aligned momenta
+            alignment = abs_short if abs_short < abs_med else abs_med
+            if abs_long < alignment:
+                alignment = abs_long
             # STRICT: Start lower, require momentum strength
             if alignment < 0.002:
                 return (None, 0)  # Too weak
             confidence = 0.50 + min(alignment * 15, 0.25)
-            return ("UPTREND", min(confidence, 0.75))
-        
-        if short_mom < -min_momentum and med_mom < -min_momentum and long_mom < -min_momentum:
-            alignment = min(abs(short_mom), abs(med_mom), abs(long_mom))
-            if alignment < 0.002:
-                return (None, 0)  # Too weak
-            confidence = 0.50 + min(alignment * 15, 0.25)
-            return ("DOWNTREND", min(confidence, 0.75))
+            return ("UPTREND" if up else "DOWNTREND", min(confidence, 0.75))
         
         # Continuation - STRICT: Must meet STREAK_THRESHOLD
-        if self.current_streak >= self.STREAK_THRESHOLD:
+        if streak >= self.STREAK_THRESHOLD:
             # STRICT: Require momentum acceleration
-            if abs(short_mom) > abs(long_mom) * 1.3:  # 30% acceleration required
+            if abs_short > abs_long * 1.3:  # 30% acceleration required
                 base_confidence = 0.50
-                streak_bonus = min((self.current_streak - self.STREAK_THRESHOLD) * 0.03, 0.15)
-                mom_bonus = min(abs(short_mom) * 5, 0.10)
+                streak_bonus = min((streak - self.STREAK_THRESHOLD) * 0.03, 0.15)
+                mom_bonus = min(abs_short * 5, 0.10)
                 confidence = base_confidence + streak_bonus + mom_bonus
                 return ("CONTINUATION", min(confidence, 0.70))
         
         # Consolidation - no signal for low confidence
-        if abs(short_mom) < 0.01 and abs(med_mom) < 0.02:
+        if abs_short < 0.01 and abs_med < 0.02:
             return ("CONSOLIDATION", 0.40)  # Below MIN_CONFIDENCE, won't generate signal
         
         return (None, 0)
     
-    def _get_direction_from_pattern(self, pattern: str, short_momentum: float) -> Optional[str]:
-        """Get trade direction based on pattern"""
-        if pattern == "REVERSAL":
-            # Trade against the streak
-            return "SELL" if self.streak_direction > 0 else "BUY"
-        
-        elif pattern == "UPTREND":
-            return "BUY"
-        
-        elif pattern == "DOWNTREND":
-            return "SELL"
-        
-        elif pattern == "CONTINUATION":
-            return "BUY" if self.streak_direction > 0 else "SELL"
-        
-        return None
+    def _update_chart_sums(self, price: float):
+        """Slide the chart-window regression sums forward by one tick"""
+        prices = self.prices
+        window = self.CHART_WINDOW
+        if len(prices) <= window:
+            # Window still growing - new price lands at x = n-1
+            self._chart_sum_xy += (len(prices) - 1) * price
+            self._chart_sum_y += price
+        else:
+            # Every x shifts down by one: drop the oldest y, add the new one at the end
+            oldest = prices[-window - 1]
+            self._chart_sum_xy += (window - 1) * price - (self._chart_sum_y - oldest)
+            self._chart_sum_y += price - oldest
+        
+        # Rebuild from the window once per turnover to bound float drift
+        self._chart_updates += 1
+        if self._chart_updates >= window:
+            chart_prices = list(islice(prices, max(len(prices) - window, 0), None))
+            self._chart_sum_y = sum(chart_prices)
+            self._chart_sum_xy = sum(x * y for x, y in enumerate(chart_prices))
+            self._chart_updates = 0
     
     def get_chart_data(self) -> Dict[str, Any]:
         """Get data for tick chart visualization"""
@@ -263,19 +309,20 @@ class TickPickerStrategy:
             return {}
         
         # Get last 50 ticks for chart
-        chart_prices = self.prices[-50:]
+        chart_prices = list(islice(self.prices, max(len(self.prices) - self.CHART_WINDOW, 0), None))
         chart_times = list(range(len(chart_prices)))
         
-        # Calculate trend line
+        # Calculate trend line - least squares on x = 0..n-1 in centred form:
+        # x_mean = (n-1)/2 and sum((x - x_mean)^2) = n(n^2-1)/12 are closed-form,
+        # sum(y) and sum(x*y) are kept up to date by add_tick
         if len(chart_prices) >= 10:
             n = len(chart_prices)
-            sum_x = sum(chart_times)
-            sum_y = sum(chart_prices)
-            sum_xy = sum(x * y for x, y in zip(chart_times, chart_prices))
-            sum_x2 = sum(x * x for x in chart_times)
+            x_mean = (n - 1) / 2
+            sxx = n * (n * n - 1) / 12
+            sum_y = self._chart_sum_y
             
-            slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x) if (n * sum_x2 - sum_x * sum_x) != 0 else 0
-            intercept = (sum_y - slope * sum_x) / n
+            slope = (self._chart_sum_xy - x_mean * sum_y) / sxx
+            intercept = sum_y / n - slope * x_mean
             
             trend_line = [slope * x + intercept for x in chart_times]
         else:
@@ -295,7 +342,14 @@ class TickPickerStrategy:
         if not self.use_martingale:
             return self.base_stake
         
-        return self.base_stake * (self.multiplier ** self.current_level)
+        level = self.current_level
+        if level < len(self._stake_table):
+            return self._stake_table[level]
+        return self.base_stake * (self.multiplier ** level)
+    
+    def _build_stake_table(self) -> List[float]:
+        """Precompute the Martingale stake for every level up to max_level"""
+        return [self.base_stake * (self.multiplier ** level) for level in range(self.max_level + 1)]
     
     def record_result(self, won: bool):
         """Record trade result for Martingale"""
@@ -310,13 +364,14 @@ class TickPickerStrategy:
         self.base_stake = base_stake
         self.multiplier = multiplier
         self.max_level = max_level
+        self._stake_table = self._build_stake_table()
     
     def get_stats(self) -> Dict[str, Any]:
         """Get strategy statistics"""
         return {
             "symbol": self.symbol,
-            "ticks_count": len(self.ticks),
-            "signals_count": len(self.signals),
+            "ticks_count": min(self._tick_count, self.prices.maxlen),
+            "signals_count": min(self.signals_count, self.SIGNAL_HISTORY),
             "current_streak": self.current_streak,
             "streak_direction": "UP" if self.streak_direction > 0 else "DOWN",
             "last_price": self.last_price,
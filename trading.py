@@ -68,6 +68,21 @@ class TradingConfig:
     unlimited_trades: bool = False  # For demo testing - no trade limit
 
 
+# Config risk level -> entry filter / money manager risk level
+ENTRY_RISK_LEVELS = {
+    "LOW": RiskLevel.LOW,
+    "MEDIUM": RiskLevel.MEDIUM,
+    "HIGH": RiskLevel.HIGH,
+    "AGGRESSIVE": RiskLevel.AGGRESSIVE
+}
+MM_RISK_LEVELS = {
+    "LOW": MMRiskLevel.LOW,
+    "MEDIUM": MMRiskLevel.MEDIUM,
+    "HIGH": MMRiskLevel.HIGH,
+    "AGGRESSIVE": MMRiskLevel.VERY_HIGH
+}
+
+
 class TradingManager:
     """
     Main Trading Manager - 100% Automatic Trading
@@ -99,9 +114,26 @@ class TradingManager:
     }
     DEFAULT_SESSION_LOSS_PCT = 0.20  # 20% default
     
+    # Strategy constructors keyed by type (called with the configured symbol)
+    STRATEGY_FACTORIES = {
+        StrategyType.MULTI_INDICATOR: MultiIndicatorStrategy,
+        StrategyType.LDP: LDPStrategy,
+        StrategyType.TICK_ANALYZER: TickAnalyzerStrategy,
+        StrategyType.TERMINAL: TerminalStrategy,
+        StrategyType.TICK_PICKER: TickPickerStrategy,
+        StrategyType.DIGITPAD: lambda symbol: DigitPadStrategy(),  # No symbol in constructor
+        StrategyType.AMT: lambda symbol: AccumulatorStrategy(),  # No symbol in constructor
+        StrategyType.SNIPER: SniperStrategy,
+    }
+    
     def __init__(self, ws: DerivWebSocket, config: Optional[TradingConfig] = None):
         self.ws = ws
         self.state = TradingState.IDLE
+        
+        # Optional WebSocket capabilities, resolved once (None when unsupported)
+        self._ws_check_health: Optional[Callable] = getattr(ws, 'check_connection_health', None)
+        self._ws_preload: Optional[Callable] = getattr(ws, 'preload_data', None)
+        self._ws_metrics: Optional[Callable] = getattr(ws, 'get_connection_metrics', None)
         self.config: Optional[TradingConfig] = config
         
         # Strategy instances
@@ -110,6 +142,13 @@ class TradingManager:
         self.money_manager = HybridMoneyManager(recovery_mode=RecoveryMode.FIBONACCI)
         self.analytics = TradingAnalytics()
         
+        # Per-tick strategy dispatch, resolved once in configure()
+        self._add_tick: Optional[Callable] = None
+        self._ticks_attr: Optional[str] = None
+        self._min_ticks = 50
+        self._signal_cooldown: Optional[float] = None
+        self._cooldown_remaining_ticks: Optional[Callable] = None
+        
         # Dynamic session loss limit
         self.session_loss_limit = 0.0
         
@@ -133,8 +172,10 @@ class TradingManager:
         self.pending_result = False
         
         # Threading
-        self._trade_lock = threading.RLock()
+        self._trade_lock = threading.Lock()
         self._stop_event = threading.Event()
+        self._pending_done = threading.Event()  # Set whenever no trade is pending
+        self._pending_done.set()
         self._auto_trade_thread: Optional[threading.Thread] = None
         self._watchdog_thread: Optional[threading.Thread] = None
         
@@ -145,6 +186,7 @@ class TradingManager:
         self.on_error: Optional[Callable] = None
         self.on_progress: Optional[Callable] = None
         self.on_timeout_warning: Optional[Callable] = None
+        self.on_state_change: Optional[Callable] = None
         
         # Last progress milestone for rate limiting
         self._last_progress_milestone = -1
@@ -154,7 +196,8 @@ class TradingManager:
         self._max_consecutive_timeouts = 5  # Increased from 3 to allow more retries
         self._last_trade_attempt = 0
         self._last_activity_time = 0
-        self._watchdog_interval = 15  # Check every 15 seconds for faster detection
+        self._watchdog_interval = 15  # Re-check interval while inactive (progressive recovery)
+        self._health_check_after = 30  # Check connection health after 30 seconds inactive
         self._stuck_threshold = 60  # Restart after 1 minute stuck (was 2 minutes)
         self._pending_trade_timeout = 45  # Clear pending_result after 45 seconds
         self._trading_paused_due_to_timeout = False
@@ -179,45 +222,20 @@ class TradingManager:
         self.config = config
         
         # Route to correct strategy class based on type
-        if config.strategy == StrategyType.MULTI_INDICATOR:
-            self.strategy = MultiIndicatorStrategy(config.symbol)
-        elif config.strategy == StrategyType.LDP:
-            self.strategy = LDPStrategy(config.symbol)
-        elif config.strategy == StrategyType.TICK_ANALYZER:
-            self.strategy = TickAnalyzerStrategy(config.symbol)
-        elif config.strategy == StrategyType.TERMINAL:
-            self.strategy = TerminalStrategy(config.symbol)
-        elif config.strategy == StrategyType.TICK_PICKER:
-            self.strategy = TickPickerStrategy(config.symbol)
-        elif config.strategy == StrategyType.DIGITPAD:
-            self.strategy = DigitPadStrategy()  # No symbol in constructor
-        elif config.strategy == StrategyType.AMT:
-            self.strategy = AccumulatorStrategy()  # No symbol in constructor
-        elif config.strategy == StrategyType.SNIPER:
-            self.strategy = SniperStrategy(config.symbol)
+        factory = self.STRATEGY_FACTORIES.get(config.strategy, MultiIndicatorStrategy)
+        self.strategy = factory(config.symbol)
+        if config.strategy == StrategyType.SNIPER:
             self.strategy.start_trading()  # Enable automatic trading for Sniper
-        else:
-            self.strategy = MultiIndicatorStrategy(config.symbol)
+        
+        self._bind_strategy()
         
         # Configure entry filter
-        risk_map = {
-            "LOW": RiskLevel.LOW,
-            "MEDIUM": RiskLevel.MEDIUM,
-            "HIGH": RiskLevel.HIGH,
-            "AGGRESSIVE": RiskLevel.AGGRESSIVE
-        }
-        self.entry_filter.set_risk_level(risk_map.get(config.risk_level, RiskLevel.MEDIUM))
+        self.entry_filter.set_risk_level(ENTRY_RISK_LEVELS.get(config.risk_level, RiskLevel.MEDIUM))
         
         # Configure money manager
-        mm_risk_map = {
-            "LOW": MMRiskLevel.LOW,
-            "MEDIUM": MMRiskLevel.MEDIUM,
-            "HIGH": MMRiskLevel.HIGH,
-            "AGGRESSIVE": MMRiskLevel.VERY_HIGH
-        }
         self.money_manager = HybridMoneyManager(
             base_stake=config.base_stake,
-            risk_level=mm_risk_map.get(config.risk_level, MMRiskLevel.MEDIUM),
+            risk_level=MM_RISK_LEVELS.get(config.risk_level, MMRiskLevel.MEDIUM),
             daily_loss_limit=config.daily_loss_limit
         )
         
@@ -227,6 +245,38 @@ class TradingManager:
         
         logger.info(f"Trading configured: {config}")
     
+    def _bind_strategy(self):
+        """Resolve add_tick signature, tick buffer and warmup size for the current strategy"""
+        strategy = self.strategy
+        if isinstance(strategy, (AccumulatorStrategy, DigitPadStrategy)):
+            # AccumulatorStrategy and DigitPadStrategy take (symbol, tick)
+            symbol = self.config.symbol if self.config else "R_100"
+            add_tick = strategy.add_tick
+            self._add_tick = lambda tick: add_tick(symbol, tick)
+        else:
+            self._add_tick = strategy.add_tick
+        
+        # Store the attribute name, not the buffer: Terminal and Sniper rebind
+        # their price list when trimming it
+        self._ticks_attr = next(
+            (name for name in ('prices', 'closes', 'tick_history')
+             if getattr(strategy, name, None) is not None),
+            None
+        )
+        self._min_ticks = getattr(strategy, 'MIN_TICKS', getattr(strategy, 'min_ticks', 50))
+        
+        # Cooldown length for strategies that track last_signal_time (None otherwise)
+        self._signal_cooldown = None
+        if hasattr(strategy, 'last_signal_time'):
+            self._signal_cooldown = getattr(strategy, 'signal_cooldown',
+                                            getattr(strategy, 'SIGNAL_COOLDOWN', 12))
+        
+        # Strategies with a tick-indexed cooldown (Terminal on fixed-rate symbols)
+        # report it in ticks; everything else is compared in wall-clock time
+        self._cooldown_remaining_ticks = None
+        if getattr(strategy, 'tick_rate', None):
+            self._cooldown_remaining_ticks = getattr(strategy, 'cooldown_remaining_ticks', None)
+    
     def _on_money_manager_pause(self, reason: str):
         """Called when money manager triggers a pause (e.g., 3x consecutive losses)"""
         logger.warning(f"Money manager triggered pause: {reason}")
@@ -291,14 +341,14 @@ class TradingManager:
         history = self.ws.get_ticks_history(self.config.symbol, 100)
         if history:
             logger.info(f"Preloading {len(history)} historical ticks into strategy")
-            for tick in history:
-                # Add tick without generating signals during warmup
-                # Handle different add_tick() signatures based on strategy instance type
-                if self.strategy and self.config:
-                    if isinstance(self.strategy, (AccumulatorStrategy, DigitPadStrategy)):
-                        self.strategy.add_tick(self.config.symbol, tick)
-                    else:
-                        self.strategy.add_tick(tick)
+            # Signals produced during warmup are discarded
+            add_ticks = getattr(self.strategy, 'add_ticks', None)
+            if add_ticks:
+                # Batch path: every tick updates state, analysis runs once
+                add_ticks(history)
+            elif self._add_tick:
+                for tick in history:
+                    self._add_tick(tick)
             logger.info(f"Strategy warmed up with {len(history)} ticks, ready to trade")
             if self.on_progress:
                 self.on_progress({
@@ -319,9 +369,9 @@ class TradingManager:
         self.ws.on_contract_update = self._on_contract_update
         self.ws.on_connection_status = self._on_connection_status
         
-        self.state = TradingState.RUNNING
+        self._set_state(TradingState.RUNNING)
         self._stop_event.clear()
-        self._last_activity_time = time.time()
+        self._last_activity_time = time.monotonic()
         self._trading_paused_due_to_timeout = False
         
         # Start watchdog timer
@@ -346,12 +396,14 @@ class TradingManager:
         def watchdog_loop():
             while self.state == TradingState.RUNNING and not self._stop_event.is_set():
                 try:
-                    time.sleep(self._watchdog_interval)
+                    # Sleep until the next check could fire; wakes immediately on stop()
+                    if self._stop_event.wait(self._watchdog_timeout()):
+                        break
                     
                     if self.state != TradingState.RUNNING:
                         break
                     
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     inactive_time = current_time - self._last_activity_time
                     
                     # Check for stuck pending trade first
@@ -359,7 +411,7 @@ class TradingManager:
                         pending_time = current_time - self._last_trade_attempt
                         if pending_time > self._pending_trade_timeout:
                             logger.warning(f"Watchdog: Pending trade stuck for {pending_time:.0f}s, clearing...")
-                            self.pending_result = False
+                            self._set_pending(False)
                             self.active_trade = None
                             self._last_activity_time = current_time
                             
@@ -371,12 +423,12 @@ class TradingManager:
                             continue
                     
                     # Progressive recovery based on inactive time
-                    if inactive_time > 30 and inactive_time <= self._stuck_threshold:
+                    if inactive_time > self._health_check_after and inactive_time <= self._stuck_threshold:
                         # After 30 seconds: check connection health
                         logger.info(f"Watchdog: Checking connection health after {inactive_time:.0f}s inactivity")
                         if self._check_and_resume_trading():
                             logger.info("Watchdog: Connection healthy, continuing...")
-                            self._last_activity_time = time.time()
+                            self._last_activity_time = time.monotonic()
                     
                     elif inactive_time > self._stuck_threshold:
                         # First check if money manager is in pause state - this is expected behavior
@@ -384,7 +436,7 @@ class TradingManager:
                             pause_status = self.money_manager.get_pause_status()
                             remaining = pause_status.get("remaining", 0)
                             logger.info(f"Watchdog: Bot in cooldown pause ({remaining}s remaining) - this is normal")
-                            self._last_activity_time = time.time()  # Reset activity time during pause
+                            self._last_activity_time = time.monotonic()  # Reset activity time during pause
                             continue
                         
                         # Check breach state
@@ -422,7 +474,32 @@ class TradingManager:
         
         self._watchdog_thread = threading.Thread(target=watchdog_loop, daemon=True)
         self._watchdog_thread.start()
-        logger.info("Watchdog timer started (interval: 15s, threshold: 60s)")
+        logger.info(
+            f"Watchdog timer started (health check: {self._health_check_after}s, "
+            f"threshold: {self._stuck_threshold}s)"
+        )
+    
+    def _watchdog_timeout(self) -> float:
+        """
+        Seconds until the earliest watchdog check could fire
+        
+        Activity and new trades only push these deadlines later, so the
+        watchdog never needs waking early - it just recomputes on wake.
+        """
+        now = time.monotonic()
+        inactive = now - self._last_activity_time
+        if inactive <= self._health_check_after:
+            remaining = self._health_check_after - inactive
+        else:
+            # Progressive recovery window: keep re-checking every interval
+            remaining = min(self._watchdog_interval, self._stuck_threshold - inactive)
+        
+        if self.pending_result and self._last_trade_attempt > 0:
+            pending_left = self._pending_trade_timeout - (now - self._last_trade_attempt)
+            remaining = min(remaining, pending_left)
+        
+        # Floor keeps a wake that lands exactly on a deadline from spinning
+        return max(1.0, remaining)
     
     def _restart_trading_session(self):
         """Restart trading session after stuck detection with connection recovery"""
@@ -433,10 +510,10 @@ class TradingManager:
             logger.info(f"Restarting trading session (attempt {self._recovery_attempts})")
             
             # Reset state
-            self._last_activity_time = time.time()
+            self._last_activity_time = time.monotonic()
             self._consecutive_timeouts = 0
             self._trading_paused_due_to_timeout = False
-            self.pending_result = False
+            self._set_pending(False)
             self.active_trade = None
             
             if self.ws and hasattr(self.ws, '_consecutive_timeouts'):
@@ -444,8 +521,8 @@ class TradingManager:
             
             if self.ws and self.config:
                 # Step 1: Check connection health
-                if hasattr(self.ws, 'check_connection_health'):
-                    if not self.ws.check_connection_health():
+                if self._ws_check_health:
+                    if not self._ws_check_health():
                         logger.warning("Connection unhealthy, attempting reconnect...")
                         # Manual reconnect
                         self.ws.disconnect()
@@ -464,8 +541,8 @@ class TradingManager:
                 time.sleep(1)
                 
                 # Step 3: Preload data and subscribe
-                if hasattr(self.ws, 'preload_data'):
-                    self.ws.preload_data(self.config.symbol, count=100)
+                if self._ws_preload:
+                    self._ws_preload(self.config.symbol, count=100)
                 
                 self.ws.subscribe_ticks(self.config.symbol, self._on_tick)
                 
@@ -485,18 +562,16 @@ class TradingManager:
         if self.state == TradingState.IDLE:
             return
         
-        self.state = TradingState.STOPPING
+        self._set_state(TradingState.STOPPING)
         self._stop_event.set()
         
         # Unsubscribe from ticks
         if self.config:
             self.ws.unsubscribe_ticks(self.config.symbol)
         
-        # Wait for any pending trade
-        wait_count = 0
-        while self.pending_result and wait_count < 30:
-            time.sleep(1)
-            wait_count += 1
+        # Wait for any pending trade (returns as soon as it settles)
+        if self.pending_result:
+            self._pending_done.wait(timeout=30)
         
         # Finalize session
         final_balance = self.ws.get_balance()
@@ -525,7 +600,24 @@ class TradingManager:
         # Clear recovery file
         self._clear_recovery_state()
         
-        self.state = TradingState.IDLE
+        self._set_state(TradingState.IDLE)
+    
+    def _set_state(self, state: TradingState):
+        """Update trading state and notify on_state_change on transitions"""
+        if state == self.state:
+            return
+        self.state = state
+        if self.on_state_change:
+            self.on_state_change(state)
+    
+    def _set_pending(self, pending: bool):
+        """Update pending_result and wake stop() once no trade is pending"""
+        if pending:
+            self._pending_done.clear()
+            self.pending_result = True
+        else:
+            self.pending_result = False
+            self._pending_done.set()
     
     def _get_win_rate(self) -> float:
         if self.session_trades == 0:
@@ -581,8 +673,11 @@ class TradingManager:
     def get_debug_info(self) -> Dict[str, Any]:
         """Get detailed debug information for troubleshooting"""
         ws_metrics = {}
-        if self.ws and hasattr(self.ws, 'get_connection_metrics'):
-            ws_metrics = self.ws.get_connection_metrics()
+        if self._ws_metrics:
+            ws_metrics = self._ws_metrics()
+        
+        # Watchdog timers are monotonic; report them as wall-clock timestamps (0 = never)
+        wall_offset = time.time() - time.monotonic()
         
         return {
             "trading_state": self.state.value,
@@ -590,8 +685,8 @@ class TradingManager:
             "active_trade": bool(self.active_trade),
             "consecutive_timeouts": self._consecutive_timeouts,
             "trading_paused": self._trading_paused_due_to_timeout,
-            "last_activity_time": self._last_activity_time,
-            "last_trade_attempt": self._last_trade_attempt,
+            "last_activity_time": self._last_activity_time + wall_offset if self._last_activity_time else 0,
+            "last_trade_attempt": self._last_trade_attempt + wall_offset if self._last_trade_attempt else 0,
             "session_stats": {
                 "trades": self.session_trades,
                 "wins": self.session_wins,
@@ -612,7 +707,9 @@ class TradingManager:
         try:
             # Track tick receipt (safely convert to float)
             tick_quote = float(tick.get('quote', 0) or 0)
-            tick_epoch = tick.get('epoch', 0)
+            
+            # Debug lines below are hot-path; skip building them when DEBUG is off
+            debug = logger.isEnabledFor(logging.DEBUG)
             
             # Track tick count for stall detection
             if not hasattr(self, '_tick_counter'):
@@ -620,26 +717,27 @@ class TradingManager:
                 self._last_tick_log_time = 0
             self._tick_counter += 1
             
+            # One clock read per tick; monotonic so the watchdog can't be fooled by clock jumps
+            now = time.monotonic()
+            
             # Log sparingly at INFO: first tick, and every 5 minutes for heartbeat confirmation
-            import time as _time
-            current_time = _time.time()
             if self._tick_counter == 1:
                 logger.info(f"📥 FIRST TICK received | Quote: {tick_quote:.5f} | Counter started")
-            elif current_time - self._last_tick_log_time >= 300:  # Every 5 minutes
+            elif now - self._last_tick_log_time >= 300:  # Every 5 minutes
                 logger.info(f"📥 TICK HEARTBEAT | Total: {self._tick_counter} ticks | Latest: {tick_quote:.5f}")
-                self._last_tick_log_time = current_time
-            else:
-                logger.debug(f"📥 TICK #{self._tick_counter} | Quote: {tick_quote:.5f} | Epoch: {tick_epoch}")
+                self._last_tick_log_time = now
+            elif debug:
+                logger.debug(f"📥 TICK #{self._tick_counter} | Quote: {tick_quote:.5f} | Epoch: {tick.get('epoch', 0)}")
             
             if self.state != TradingState.RUNNING:
-                logger.debug(f"⏸️ Tick ignored - state is {self.state.value}")
+                if debug:
+                    logger.debug(f"⏸️ Tick ignored - state is {self.state.value}")
                 return
             
-            self._last_activity_time = time.time()
+            self._last_activity_time = now
             
             if self.pending_result:
                 logger.debug("⏳ Tick ignored - waiting for pending trade result")
-                self._last_activity_time = time.time()
                 return  # Wait for current trade to complete
             
             if not self.strategy:
@@ -647,73 +745,67 @@ class TradingManager:
                 return
             
             # Log strategy info
-            strategy_name = type(self.strategy).__name__
-            strategy_ticks = 0
-            prices_attr = getattr(self.strategy, 'prices', None)
-            closes_attr = getattr(self.strategy, 'closes', None)
-            tick_history_attr = getattr(self.strategy, 'tick_history', None)
-            if prices_attr is not None:
-                strategy_ticks = len(prices_attr)
-            elif closes_attr is not None:
-                strategy_ticks = len(closes_attr)
-            elif tick_history_attr is not None:
-                strategy_ticks = len(tick_history_attr)
-            
-            logger.debug(f"📊 Processing tick with {strategy_name} (data points: {strategy_ticks})")
-            
-            with self._trade_lock:
-                # Add tick to strategy and get signal
-                # Handle different add_tick() signatures based on strategy instance type
-                try:
-                    if isinstance(self.strategy, (AccumulatorStrategy, DigitPadStrategy)):
-                        # AccumulatorStrategy and DigitPadStrategy take (symbol, tick)
-                        symbol = self.config.symbol if self.config else "R_100"
-                        signal = self.strategy.add_tick(symbol, tick)
-                    else:
-                        # Other strategies take (tick) only
-                        signal = self.strategy.add_tick(tick)
+            strategy_ticks = len(getattr(self.strategy, self._ticks_attr)) if self._ticks_attr else 0
+            min_ticks = self._min_ticks
+            if debug:
+                logger.debug(f"📊 Processing tick with {type(self.strategy).__name__} (data points: {strategy_ticks})")
+            
+            # Add tick to strategy and get signal (signature resolved in _bind_strategy)
+            try:
+                signal = self._add_tick(tick)
+                
+                # Log analysis result - keep most at DEBUG level; at INFO only
+                # the two warmup milestones produce output
+                warmup_milestone = strategy_ticks == min_ticks // 2 or strategy_ticks == min_ticks - 1
+                if signal is None and (debug or warmup_milestone):
+                    # Try to get more info about why no signal
+                    cooldown_info = ""
+                    in_cooldown = False
+                    cooldown = self._signal_cooldown
+                    if self._cooldown_remaining_ticks:
+                        remaining_ticks = self._cooldown_remaining_ticks()
+                        if remaining_ticks:
+                            cooldown_info = f" (cooldown: {remaining_ticks} ticks left)"
+                            in_cooldown = True
+                    elif cooldown is not None:
+                        # Strategies stamp last_signal_time with wall-clock time
+                        elapsed = time.time() - self.strategy.last_signal_time
+                        if elapsed < cooldown:
+                            cooldown_info = f" (cooldown: {elapsed:.1f}s/{cooldown}s)"
+                            in_cooldown = True
                     
-                    # Log analysis result - keep most at DEBUG level
-                    if signal is None:
-                        # Try to get more info about why no signal
-                        cooldown_info = ""
-                        in_cooldown = False
-                        if hasattr(self.strategy, 'last_signal_time'):
-                            elapsed = time.time() - self.strategy.last_signal_time
-                            cooldown = getattr(self.strategy, 'signal_cooldown', 
-                                             getattr(self.strategy, 'SIGNAL_COOLDOWN', 12))
-                            if elapsed < cooldown:
-                                cooldown_info = f" (cooldown: {elapsed:.1f}s/{cooldown}s)"
-                                in_cooldown = True
-                        
-                        min_ticks = getattr(self.strategy, 'MIN_TICKS', 
-                                          getattr(self.strategy, 'min_ticks', 50))
-                        if strategy_ticks < min_ticks:
-                            # Log warmup once at 50% and 100% completion
-                            if strategy_ticks == min_ticks // 2:
-                                logger.info(f"📈 Warmup 50%: {strategy_ticks}/{min_ticks} ticks{cooldown_info}")
-                            elif strategy_ticks == min_ticks - 1:
-                                logger.info(f"📈 Warmup complete: {min_ticks} ticks ready{cooldown_info}")
-                            else:
-                                logger.debug(f"📈 Warming up: {strategy_ticks}/{min_ticks}{cooldown_info}")
-                        elif in_cooldown:
-                            logger.debug(f"⏳ In cooldown{cooldown_info}")
+                    if strategy_ticks < min_ticks:
+                        # Log warmup once at 50% and 100% completion
+                        if strategy_ticks == min_ticks // 2:
+                            logger.info(f"📈 Warmup 50%: {strategy_ticks}/{min_ticks} ticks{cooldown_info}")
+                        elif strategy_ticks == min_ticks - 1:
+                            logger.info(f"📈 Warmup complete: {min_ticks} ticks ready{cooldown_info}")
                         else:
-                            logger.debug(f"🔍 No signal - analyzing market")
-                except Exception as strategy_error:
-                    logger.error(f"Strategy add_tick error: {strategy_error}", exc_info=True)
-                    signal = None
-                
-                if signal:
-                    signal_type = type(signal).__name__
-                    signal_dir = getattr(signal, 'direction', getattr(signal, 'contract_type', 'N/A'))
-                    signal_conf = getattr(signal, 'confidence', 0)
-                    signal_reason = getattr(signal, 'reason', 'N/A')
-                    logger.info(f"🎯 SIGNAL RECEIVED | Type: {signal_type} | "
-                               f"Direction: {signal_dir} | Confidence: {signal_conf:.2%}")
-                    logger.info(f"📋 Signal reason: {signal_reason}")
+                            logger.debug(f"📈 Warming up: {strategy_ticks}/{min_ticks}{cooldown_info}")
+                    elif in_cooldown:
+                        logger.debug(f"⏳ In cooldown{cooldown_info}")
+                    else:
+                        logger.debug(f"🔍 No signal - analyzing market")
+            except Exception as strategy_error:
+                logger.error(f"Strategy add_tick error: {strategy_error}", exc_info=True)
+                signal = None
+            
+            if signal:
+                signal_type = type(signal).__name__
+                signal_dir = getattr(signal, 'direction', getattr(signal, 'contract_type', 'N/A'))
+                signal_conf = getattr(signal, 'confidence', 0)
+                signal_reason = getattr(signal, 'reason', 'N/A')
+                logger.info(f"🎯 SIGNAL RECEIVED | Type: {signal_type} | "
+                           f"Direction: {signal_dir} | Confidence: {signal_conf:.2%}")
+                logger.info(f"📋 Signal reason: {signal_reason}")
+                # Only the pending-trade check and dispatch need serialising;
+                # strategy analysis runs on the single tick thread unlocked
+                with self._trade_lock:
+                    if self.pending_result:
+                        logger.debug("⏳ Signal dropped - trade already pending")
+                        return
                     self._process_signal(signal)
-                    
+                
         except Exception as e:
             logger.error(f"Error in _on_tick: {e}", exc_info=True)
     
@@ -894,8 +986,8 @@ class TradingManager:
                 return
         
         # Set pending_result immediately to prevent duplicate trades
-        self.pending_result = True
-        self._last_trade_attempt = time.time()
+        self._set_pending(True)
+        self._last_trade_attempt = time.monotonic()
         
         # Capture signal data for thread
         signal_confidence = signal.confidence if hasattr(signal, 'confidence') else 0.5
@@ -909,7 +1001,7 @@ class TradingManager:
         if isinstance(signal, AccumulatorSignal):
             if signal.action != "ENTER":
                 logger.debug(f"Accumulator signal action is {signal.action}, not ENTER - skipping")
-                self.pending_result = False
+                self._set_pending(False)
                 return
             contract_type = "ACCU"
             growth_rate = signal.growth_rate / 100.0  # Convert 1-5 to 0.01-0.05
@@ -966,7 +1058,7 @@ class TradingManager:
                 self._execute_trade_worker(contract_type, stake, signal_confidence, barrier, growth_rate)
             except Exception as e:
                 logger.error(f"Trade worker error: {e}")
-                self.pending_result = False
+                self._set_pending(False)
                 self._handle_trade_failure(signal, str(e))
         
         trade_thread = threading.Thread(target=trade_worker, daemon=True)
@@ -977,7 +1069,7 @@ class TradingManager:
         """Worker method that actually executes the trade (runs in separate thread)"""
         if not self.config:
             logger.error("❌ No config available in trade worker")
-            self.pending_result = False
+            self._set_pending(False)
             return
         
         try:
@@ -1022,7 +1114,7 @@ class TradingManager:
             
             if result and result.get("contract_id"):
                 self._consecutive_timeouts = 0
-                self._last_activity_time = time.time()
+                self._last_activity_time = time.monotonic()
                 
                 # Get current tick price as fallback for entry_price
                 current_tick_price = 0.0
@@ -1054,11 +1146,11 @@ class TradingManager:
                     logger.debug(f"Triggering on_trade_opened callback: contract_id={result['contract_id']}")
                     self.on_trade_opened(self.active_trade)
             else:
-                self.pending_result = False
+                self._set_pending(False)
                 self._handle_trade_failure_internal(contract_type)
                 
         except Exception as e:
-            self.pending_result = False
+            self._set_pending(False)
             logger.error(f"Error executing trade: {e}")
             self._handle_trade_failure_internal(contract_type, str(e))
     
@@ -1154,7 +1246,7 @@ class TradingManager:
             return False
         
         try:
-            if hasattr(self.ws, 'check_connection_health') and self.ws.check_connection_health():
+            if self._ws_check_health and self._ws_check_health():
                 self._trading_paused_due_to_timeout = False
                 self._consecutive_timeouts = 0
                 
@@ -1191,7 +1283,7 @@ class TradingManager:
                 # Reset timeout counters
                 self._consecutive_timeouts = 0
                 self._trading_paused_due_to_timeout = False
-                self._last_activity_time = time.time()
+                self._last_activity_time = time.monotonic()
                 
                 if self.on_progress:
                     self.on_progress({
@@ -1337,8 +1429,8 @@ class TradingManager:
             
             # Clear active trade and update activity time
             self.active_trade = None
-            self.pending_result = False
-            self._last_activity_time = time.time()
+            self._set_pending(False)
+            self._last_activity_time = time.monotonic()
             
             # Save recovery state
             self._save_recovery_state()